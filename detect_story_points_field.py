@@ -5,10 +5,20 @@ This helps you find the correct customfield_XXXXX to use in your configuration.
 """
 
 import os
+import re
 import sys
-import requests
 from dotenv import load_dotenv
 
+# Share the pooled session, JSON decoding and field name patterns with the
+# KPI script; importing it has no side effects
+from jira_sprint_kpi import (
+    SESSION,
+    _EXACT_PATTERNS,
+    _EXCLUDE_PATTERN,
+    _all_fields,
+    _loads,
+)
+
 # Load environment variables
 load_dotenv()
 
@@ -16,6 +26,11 @@ JIRA_BASE_URL = os.getenv("JIRA_BASE_URL")
 EMAIL = os.getenv("JIRA_EMAIL")
 API_TOKEN = os.getenv("JIRA_API_TOKEN")
 
+SESSION.auth = (EMAIL, API_TOKEN)
+
+# Partial matches here also accept "sp", which the KPI script's pattern does not
+_PARTIAL_PATTERN = re.compile("story point|estimate|sp")
+
 
 def detect_story_points_field(sprint_id=None, issue_key=None):
     """
@@ -30,19 +45,21 @@ def detect_story_points_field(sprint_id=None, issue_key=None):
         print("Please set JIRA_BASE_URL, JIRA_EMAIL, and JIRA_API_TOKEN in your .env file")
         sys.exit(1)
     
-    auth = (EMAIL, API_TOKEN)
-    
-    # Get a sample issue
+    # Get a sample issue along with a mapping of field IDs to names
     issue = None
+    field_names = {}
     
     if issue_key:
         # Fetch specific issue
         print(f"Fetching issue {issue_key}...")
         url = f"{JIRA_BASE_URL}/rest/api/2/issue/{issue_key}"
+        # expand=names returns field display names alongside the issue
+        params = {"expand": "names"}
         try:
-            resp = requests.get(url, auth=auth)
+            resp = SESSION.get(url, params=params)
             resp.raise_for_status()
-            issue = resp.json()
+            issue = _loads(resp.content)
+            field_names = issue.get("names") or {}
         except Exception as e:
             print(f"Error fetching issue {issue_key}: {e}")
             return None
@@ -51,16 +68,20 @@ def detect_story_points_field(sprint_id=None, issue_key=None):
         # Fetch first issue from sprint
         print(f"Fetching sample issue from sprint {sprint_id}...")
         url = f"{JIRA_BASE_URL}/rest/agile/1.0/sprint/{sprint_id}/issue"
-        params = {"startAt": 0, "maxResults": 5}
+        # expand=names returns field display names in the same response,
+        # so no separate field metadata request is normally needed
+        params = {"startAt": 0, "maxResults": 5, "expand": "names"}
         try:
-            resp = requests.get(url, params=params, auth=auth)
+            resp = SESSION.get(url, params=params)
             resp.raise_for_status()
-            data = resp.json()
+            data = _loads(resp.content)
             
             if not data.get("issues"):
                 print("No issues found in sprint")
                 return None
             
+            field_names = data.get("names") or {}
+            
             # Try to find an issue with story points
             for iss in data["issues"]:
                 fields = iss.get("fields", {})
@@ -86,6 +107,13 @@ def detect_story_points_field(sprint_id=None, issue_key=None):
         print("Could not fetch a sample issue")
         return None
     
+    if not field_names:
+        # Response had no names map, fall back to the (cached) field catalog
+        try:
+            field_names = {f["id"]: f["name"] for f in _all_fields(JIRA_BASE_URL) if "id" in f and "name" in f}
+        except Exception as e:
+            print(f"Error fetching field metadata: {e}")
+    
     print(f"\nAnalyzing issue: {issue.get('key', 'Unknown')}")
     print("-" * 60)
     
@@ -95,128 +123,87 @@ def detect_story_points_field(sprint_id=None, issue_key=None):
     print("\nCustom fields with numeric values (potential story points):")
     print("-" * 60)
     
-    potential_fields = []
-    for field_id, field_value in sorted(fields.items()):
-        if field_id.startswith("customfield_"):
-            if isinstance(field_value, (int, float)):
-                potential_fields.append((field_id, field_value))
-                print(f"  {field_id}: {field_value}")
+    # Filter first so only the short list of numeric custom fields is sorted
+    potential_fields = [
+        (field_id, field_value)
+        for field_id, field_value in fields.items()
+        if field_id.startswith("customfield_") and isinstance(field_value, (int, float))
+    ]
+    potential_fields.sort()
+    for field_id, field_value in potential_fields:
+        print(f"  {field_id}: {field_value}")
     
     if not potential_fields:
         print("  No numeric custom fields found")
     
-    # Try to get field metadata to show names
-    print("\n\nFetching field metadata to show field names...")
-    print("-" * 60)
+    print("\n\nFields matching story points patterns:")
+    exact_matches = []
+    partial_matches = []
+    
+    custom_fields = [
+        (field_id, field_name)
+        for field_id, field_name in field_names.items()
+        if field_id.startswith("customfield_")
+    ]
+    
+    for field_id, field_name in custom_fields:
+        field_name_lower = field_name.lower()
+    
+        # Check for exact matches first, then partial matches
+        if any(p.match(field_name_lower) for p in _EXACT_PATTERNS):
+            exact_matches.append((field_id, field_name))
+        elif _PARTIAL_PATTERN.search(field_name_lower) and not _EXCLUDE_PATTERN.search(field_name_lower):
+            partial_matches.append((field_id, field_name))
+    
+    found_matches = exact_matches + partial_matches
+    
+    for field_id, field_name in found_matches:
+        # Check if this field has a value in our sample issue
+        field_value = fields.get(field_id)
+        value_str = f" = {field_value}" if field_value is not None else " (no value in sample)"
+        marker = "  ✓✓" if (field_id, field_name) in exact_matches else "  ✓"
+        print(f"{marker} {field_id}: {field_name}{value_str}")
+    
+    if not found_matches:
+        print("  No fields found matching common story points patterns")
+    
+    # Show all potential fields with their names
+    if potential_fields:
+        print("\n\nAll numeric custom fields with names:")
+        print("-" * 60)
+        for field_id, field_value in potential_fields:
+            field_name = field_names.get(field_id, "Unknown")
+            print(f"  {field_id}: {field_name} = {field_value}")
+    
+    # Make a recommendation
+    print("\n\n" + "=" * 60)
+    print("RECOMMENDATION:")
+    print("=" * 60)
+    
+    if exact_matches:
+        recommended = exact_matches[0][0]
+        recommended_name = exact_matches[0][1]
+        print(f"Based on exact field name match, the story points field is:")
+        print(f"  {recommended} ({recommended_name})")
+    elif found_matches:
+        recommended = found_matches[0][0]
+        recommended_name = found_matches[0][1]
+        print(f"Based on field names, the story points field is likely:")
+        print(f"  {recommended} ({recommended_name})")
+    elif potential_fields:
+        recommended = potential_fields[0][0]
+        recommended_name = field_names.get(recommended, "Unknown")
+        print(f"Based on numeric values, the story points field might be:")
+        print(f"  {recommended} ({recommended_name})")
+    else:
+        print("Could not determine story points field.")
+        print("Common defaults to try: customfield_10016, customfield_10004, customfield_10026")
+        recommended = "customfield_10016"
     
-    try:
-        fields_url = f"{JIRA_BASE_URL}/rest/api/2/field"
-        fields_resp = requests.get(fields_url, auth=auth)
-        fields_resp.raise_for_status()
-        all_fields = fields_resp.json()
-        
-        # Create a mapping of field IDs to names
-        field_names = {f["id"]: f["name"] for f in all_fields if "id" in f and "name" in f}
-        
-        # Show potential story points fields with names
-        # Prioritize exact matches for "Story Points" or "Story Point Estimate"
-        exact_patterns = [
-            r"^story points?$",
-            r"^story point estimate$",
-            r"^points?$",
-        ]
-        
-        partial_patterns = [
-            "story points", "story point", "estimate", "sp"
-        ]
-        
-        print("\nFields matching story points patterns:")
-        exact_matches = []
-        partial_matches = []
-        
-        for field in all_fields:
-            field_id = field.get("id", "")
-            field_name = field.get("name", "")
-            field_name_lower = field_name.lower()
-            
-            if not field_id.startswith("customfield_"):
-                continue
-            
-            # Check for exact matches first
-            import re
-            is_exact = False
-            for pattern in exact_patterns:
-                if re.match(pattern, field_name_lower):
-                    exact_matches.append((field_id, field_name))
-                    is_exact = True
-                    break
-            
-            # If not exact, check partial matches
-            if not is_exact:
-                for pattern in partial_patterns:
-                    if pattern in field_name_lower:
-                        # Exclude fields that are clearly not story points
-                        exclude_terms = ["sprint", "response", "chart", "date", "time", "ready", "spec"]
-                        if not any(term in field_name_lower for term in exclude_terms):
-                            partial_matches.append((field_id, field_name))
-                        break
-        
-        found_matches = exact_matches + partial_matches
-        
-        for field_id, field_name in found_matches:
-            # Check if this field has a value in our sample issue
-            field_value = fields.get(field_id)
-            value_str = f" = {field_value}" if field_value is not None else " (no value in sample)"
-            marker = "  ✓✓" if (field_id, field_name) in exact_matches else "  ✓"
-            print(f"{marker} {field_id}: {field_name}{value_str}")
-        
-        if not found_matches:
-            print("  No fields found matching common story points patterns")
-        
-        # Show all potential fields with their names
-        if potential_fields:
-            print("\n\nAll numeric custom fields with names:")
-            print("-" * 60)
-            for field_id, field_value in potential_fields:
-                field_name = field_names.get(field_id, "Unknown")
-                print(f"  {field_id}: {field_name} = {field_value}")
-        
-        # Make a recommendation
-        print("\n\n" + "=" * 60)
-        print("RECOMMENDATION:")
-        print("=" * 60)
-        
-        if exact_matches:
-            recommended = exact_matches[0][0]
-            recommended_name = exact_matches[0][1]
-            print(f"Based on exact field name match, the story points field is:")
-            print(f"  {recommended} ({recommended_name})")
-        elif found_matches:
-            recommended = found_matches[0][0]
-            recommended_name = found_matches[0][1]
-            print(f"Based on field names, the story points field is likely:")
-            print(f"  {recommended} ({recommended_name})")
-        elif potential_fields:
-            recommended = potential_fields[0][0]
-            recommended_name = field_names.get(recommended, "Unknown")
-            print(f"Based on numeric values, the story points field might be:")
-            print(f"  {recommended} ({recommended_name})")
-        else:
-            print("Could not determine story points field.")
-            print("Common defaults to try: customfield_10016, customfield_10004, customfield_10026")
-            recommended = "customfield_10016"
-        
-        print("\nAdd this to your .env file:")
-        print(f"JIRA_STORY_POINTS_FIELD={recommended}")
-        
-        return recommended
-        
-    except Exception as e:
-        print(f"Error fetching field metadata: {e}")
-        if potential_fields:
-            print(f"\nBest guess based on numeric values: {potential_fields[0][0]}")
-            return potential_fields[0][0]
-        return None
+    print("\nAdd this to your .env file:")
+    print(f"JIRA_STORY_POINTS_FIELD={recommended}")
+    
+    return recommended
 
 
 if __name__ == "__main__":
@@ -1,48 +1,191 @@
 import os
+import re
 import csv
 import sys
+import json
+import time
+import hashlib
+import functools
 import argparse
-from collections import defaultdict
+import itertools
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-import statistics
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib parser
+    orjson = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:  # ciso8601 is optional, fall back to the stdlib parser
+    if sys.version_info >= (3, 11):
+        # Accepts Jira's "Z" and "+0000" offsets natively
+        _parse_datetime = datetime.fromisoformat
+    else:
+        def _parse_datetime(value):
+            # %z accepts both "Z" and Jira's "+0000" style offsets
+            return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
 
 
-# === Load environment variables from .env ===
-print("DEBUG: Attempting to load .env file...")
-dotenv_loaded = load_dotenv()  # looks for .env in the current directory
-print(f"DEBUG: .env file loaded successfully: {dotenv_loaded}")
-
-# Check if .env file exists and show its contents
-env_file_path = ".env"
-if os.path.exists(env_file_path):
-    print(f"DEBUG: .env file exists at: {os.path.abspath(env_file_path)}")
-    with open(env_file_path, 'r') as f:
-        content = f.read().strip()
-        if content:
-            print(f"DEBUG: .env file has {len(content.splitlines())} lines of content")
-        else:
-            print("DEBUG: .env file is EMPTY - this is the problem!")
-else:
-    print("DEBUG: .env file does NOT exist")
-
-JIRA_BASE_URL = os.getenv("JIRA_BASE_URL")
-EMAIL = os.getenv("JIRA_EMAIL")
-API_TOKEN = os.getenv("JIRA_API_TOKEN")
-STORY_POINTS_FIELD = os.getenv("JIRA_STORY_POINTS_FIELD")
-
-print(f"DEBUG: Environment variables loaded:")
-print(f"  JIRA_BASE_URL: {'SET' if JIRA_BASE_URL else 'NOT SET'}")
-print(f"  JIRA_EMAIL: {'SET' if EMAIL else 'NOT SET'}")
-print(f"  JIRA_API_TOKEN: {'SET' if API_TOKEN else 'NOT SET'}")
-print(f"  JIRA_STORY_POINTS_FIELD: {'SET' if STORY_POINTS_FIELD else 'NOT SET'}")
+# Jira settings, populated from .env / the environment by load_config().
+# Nothing is read at import time so the module can be imported cheaply.
+JIRA_BASE_URL = None
+EMAIL = None
+API_TOKEN = None
+STORY_POINTS_FIELD = None
 
 # Some Jira instances use different "done" statuses.
 # This uses the statusCategory.key, which is usually "done" for any done-like status.
 DONE_STATUS_CATEGORIES = {"done"}
 
+# Story points field name matching, compiled once instead of per field.
+# Prioritize exact matches for "Story Points" or "Story Point Estimate".
+_EXACT_PATTERNS = [
+    re.compile(p) for p in (r"^story points?$", r"^story point estimate$", r"^points?$")
+]
+# Substring alternations: any field name containing one of these terms,
+# minus fields that are clearly not story points
+_PARTIAL_PATTERN = re.compile("story point|estimate")
+_EXCLUDE_PATTERN = re.compile("sprint|response|chart|date|time|ready|spec")
+
+# Page size for the sprint issue endpoint and how many pages to fetch at once.
+PAGE_SIZE = 100
+MAX_WORKERS = 8
+
+# Shared session so every request reuses pooled keep-alive connections.
+# Retries back off exponentially on rate limiting / transient gateway errors
+# and honor Retry-After.
+SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504]),
+)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
+
+def _loads(content):
+    """
+    Decode a JSON document from bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _dumps(obj):
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+# Field metadata rarely changes, so /rest/api/2/field is cached on disk between runs.
+FIELDS_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "jira_kpi")
+FIELDS_CACHE_TTL = 24 * 3600  # seconds
+
+
+def _fields_cache_path(base_url):
+    digest = hashlib.sha256(base_url.rstrip("/").encode("utf-8")).hexdigest()[:16]
+    return os.path.join(FIELDS_CACHE_DIR, f"fields-{digest}.json")
+
+
+def get_fields_cached(base_url, ttl=FIELDS_CACHE_TTL):
+    """
+    Return the Jira field catalog, served from the on-disk cache while it is fresh.
+    """
+    cache_path = _fields_cache_path(base_url)
+    try:
+        if time.time() - os.path.getmtime(cache_path) < ttl:
+            with open(cache_path, "rb") as f:
+                return _loads(f.read())
+    except (OSError, ValueError):
+        pass  # Missing or corrupt cache, fetch a fresh copy
+
+    resp = SESSION.get(f"{base_url}/rest/api/2/field")
+    resp.raise_for_status()
+    all_fields = _loads(resp.content)
+
+    try:
+        os.makedirs(FIELDS_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_dumps(all_fields))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"  Warning: Could not write field metadata cache: {e}")
+
+    return all_fields
+
+
+@functools.lru_cache(maxsize=1)
+def _all_fields(base_url):
+    # Memoized per process so repeated lookups within one run never refetch
+    return get_fields_cached(base_url)
+
+
+def clear_fields_cache(base_url):
+    """
+    Remove the cached field catalog so the next lookup refetches it.
+    """
+    _all_fields.cache_clear()
+    try:
+        os.remove(_fields_cache_path(base_url))
+    except FileNotFoundError:
+        pass
+
+
+def load_config():
+    """
+    Load Jira settings from .env and the environment into the module globals
+    and attach the credentials to the shared session.
+    Set JIRA_KPI_DEBUG to print .env diagnostics.
+    """
+    global JIRA_BASE_URL, EMAIL, API_TOKEN, STORY_POINTS_FIELD
+
+    dotenv_loaded = load_dotenv()  # looks for .env in the current directory
+
+    JIRA_BASE_URL = os.getenv("JIRA_BASE_URL")
+    EMAIL = os.getenv("JIRA_EMAIL")
+    API_TOKEN = os.getenv("JIRA_API_TOKEN")
+    STORY_POINTS_FIELD = os.getenv("JIRA_STORY_POINTS_FIELD")
+
+    SESSION.auth = (EMAIL, API_TOKEN)
+
+    if os.getenv("JIRA_KPI_DEBUG"):
+        _debug_env(dotenv_loaded)
+
+
+def _debug_env(dotenv_loaded):
+    print(f"DEBUG: .env file loaded successfully: {dotenv_loaded}")
+
+    # Check if .env file exists and show its contents
+    env_file_path = ".env"
+    if os.path.exists(env_file_path):
+        print(f"DEBUG: .env file exists at: {os.path.abspath(env_file_path)}")
+        with open(env_file_path, 'r') as f:
+            content = f.read().strip()
+            if content:
+                print(f"DEBUG: .env file has {len(content.splitlines())} lines of content")
+            else:
+                print("DEBUG: .env file is EMPTY - this is the problem!")
+    else:
+        print("DEBUG: .env file does NOT exist")
+
+    print(f"DEBUG: Environment variables loaded:")
+    print(f"  JIRA_BASE_URL: {'SET' if JIRA_BASE_URL else 'NOT SET'}")
+    print(f"  JIRA_EMAIL: {'SET' if EMAIL else 'NOT SET'}")
+    print(f"  JIRA_API_TOKEN: {'SET' if API_TOKEN else 'NOT SET'}")
+    print(f"  JIRA_STORY_POINTS_FIELD: {'SET' if STORY_POINTS_FIELD else 'NOT SET'}")
+
 
 def ensure_config():
     """
@@ -75,17 +218,14 @@ def detect_story_points_field(sprint_id: int):
     Auto-detect the story points field by fetching a sample issue and analyzing fields.
     Returns the most likely story points field ID.
     """
-    import re
-    auth = (EMAIL, API_TOKEN)
-    
     # Fetch first issue from sprint
     url = f"{JIRA_BASE_URL}/rest/agile/1.0/sprint/{sprint_id}/issue"
     params = {"startAt": 0, "maxResults": 1}
     
     try:
-        resp = requests.get(url, params=params, auth=auth)
+        resp = SESSION.get(url, params=params)
         resp.raise_for_status()
-        data = resp.json()
+        data = _loads(resp.content)
         
         if not data.get("issues"):
             raise ValueError("No issues found in sprint to detect story points field")
@@ -94,45 +234,30 @@ def detect_story_points_field(sprint_id: int):
         fields = issue.get("fields", {})
         
         # Try to get field metadata to find by name (most reliable method)
-        fields_url = f"{JIRA_BASE_URL}/rest/api/2/field"
-        fields_resp = requests.get(fields_url, auth=auth)
+        try:
+            all_fields = _all_fields(JIRA_BASE_URL)
+        except requests.RequestException:
+            all_fields = None
         
-        if fields_resp.ok:
-            all_fields = fields_resp.json()
-            
-            # Prioritize exact matches for "Story Points" or "Story Point Estimate"
-            exact_patterns = [
-                r"^story points?$",
-                r"^story point estimate$",
-                r"^points?$",
-            ]
-            
-            partial_patterns = ["story points", "story point", "estimate"]
-            exclude_terms = ["sprint", "response", "chart", "date", "time", "ready", "spec"]
+        if all_fields:
             
             exact_matches = []
             partial_matches = []
             
-            for field in all_fields:
-                field_name = field.get("name", "")
+            for field_meta in all_fields:
+                field_name = field_meta.get("name", "")
                 field_name_lower = field_name.lower()
-                field_id = field.get("id", "")
+                field_id = field_meta.get("id", "")
                 
                 if not field_id.startswith("customfield_"):
                     continue
                 
                 # Check for exact matches first
-                for pattern in exact_patterns:
-                    if re.match(pattern, field_name_lower):
-                        exact_matches.append((field_id, field_name))
-                        break
-                else:
-                    # Check partial matches, excluding non-story-point fields
-                    for pattern in partial_patterns:
-                        if pattern in field_name_lower:
-                            if not any(term in field_name_lower for term in exclude_terms):
-                                partial_matches.append((field_id, field_name))
-                            break
+                if any(p.match(field_name_lower) for p in _EXACT_PATTERNS):
+                    exact_matches.append((field_id, field_name))
+                # Check partial matches, excluding non-story-point fields
+                elif _PARTIAL_PATTERN.search(field_name_lower) and not _EXCLUDE_PATTERN.search(field_name_lower):
+                    partial_matches.append((field_id, field_name))
             
             if exact_matches:
                 detected_field = exact_matches[0][0]
@@ -166,135 +291,143 @@ def detect_story_points_field(sprint_id: int):
         return "customfield_10016"
 
 
-def fetch_issues_for_sprint(sprint_id: int):
+def iter_issues_for_sprint(sprint_id: int):
     """
-    Fetch all issues in the given sprint using Jira Agile API with pagination.
+    Yield all issues in the given sprint using Jira Agile API with pagination.
+    The first page reports the total; remaining pages are fetched concurrently
+    through a window of MAX_WORKERS in-flight requests and yielded in order, so
+    at most that many pages are buffered at once.
     """
-    issues = []
-    start_at = 0
-    max_results = 100
-
-    auth = (EMAIL, API_TOKEN)
+    url = f"{JIRA_BASE_URL}/rest/agile/1.0/sprint/{sprint_id}/issue"
+    # Only request the fields compute_metrics reads to keep pages small
+    fields = f"assignee,status,issuetype,created,resolutiondate,{STORY_POINTS_FIELD}"
 
-    while True:
-        url = f"{JIRA_BASE_URL}/rest/agile/1.0/sprint/{sprint_id}/issue"
-        params = {"startAt": start_at, "maxResults": max_results}
-        resp = requests.get(url, params=params, auth=auth)
+    def fetch_page(start_at):
+        params = {"startAt": start_at, "maxResults": PAGE_SIZE, "fields": fields}
+        resp = SESSION.get(url, params=params)
         resp.raise_for_status()
-        data = resp.json()
-
-        issues.extend(data.get("issues", []))
-
-        total = data.get("total", 0)
-        start_at += max_results
-        if start_at >= total:
-            break
-
-    return issues
-
-
-def get_assignee_name(issue):
-    assignee = issue["fields"].get("assignee")
-    if assignee is None:
-        return "Unassigned"
-    return assignee.get("displayName") or assignee.get("emailAddress") or "Unknown"
-
-
-def get_status_category(issue):
-    status = issue["fields"].get("status") or {}
-    status_category = status.get("statusCategory") or {}
-    # Typically: "new", "indeterminate", "done"
-    return status_category.get("key", "").lower()
-
-
-def get_issue_type(issue):
-    issue_type = issue["fields"].get("issuetype") or {}
-    return issue_type.get("name", "Unknown")
-
-
-def get_story_points(issue):
-    # Story points may be None or missing
-    sp = issue["fields"].get(STORY_POINTS_FIELD)
-    if sp is None:
-        return 0.0
-    try:
-        return float(sp)
-    except (TypeError, ValueError):
-        return 0.0
-
-
-def get_cycle_time_days(issue):
+        return _loads(resp.content)
+
+    data = fetch_page(0)
+    yield from data.get("issues", [])
+
+    total = data.get("total", 0)
+    offsets = iter(range(PAGE_SIZE, total, PAGE_SIZE))
+    if total > PAGE_SIZE:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # Keep at most MAX_WORKERS pages in flight, submitting the next
+            # offset as each page is consumed, and yield them in offset order
+            pending = deque(
+                executor.submit(fetch_page, start_at)
+                for start_at in itertools.islice(offsets, MAX_WORKERS)
+            )
+            while pending:
+                page = pending.popleft().result()
+                next_start = next(offsets, None)
+                if next_start is not None:
+                    pending.append(executor.submit(fetch_page, next_start))
+                yield from page.get("issues", [])
+
+
+def get_cycle_time_days(fields):
     """
     Calculate cycle time in days (from first transition to done status to completion).
-    Returns 0 if cannot be calculated.
+    Takes the issue's "fields" dict. Returns 0 if cannot be calculated.
     """
     try:
-        created = issue["fields"].get("created")
-        resolved = issue["fields"].get("resolutiondate")
+        created = fields.get("created")
+        resolved = fields.get("resolutiondate")
         
         if not created or not resolved:
             return 0.0
             
-        created_dt = datetime.fromisoformat(created.replace('Z', '+00:00'))
-        resolved_dt = datetime.fromisoformat(resolved.replace('Z', '+00:00'))
-        
-        delta = resolved_dt - created_dt
-        return round(delta.total_seconds() / (24 * 3600), 1)  # Convert to days
+        delta_seconds = _parse_datetime(resolved).timestamp() - _parse_datetime(created).timestamp()
+        return round(delta_seconds / (24 * 3600), 1)  # Convert to days
     except (ValueError, TypeError, AttributeError):
         return 0.0
 
 
+@dataclass(slots=True)
+class AssigneeMetrics:
+    """
+    Per-assignee counters accumulated by compute_metrics.
+    """
+    total_issues: int = 0
+    completed_issues: int = 0
+    total_story_points: float = 0.0
+    completed_story_points: float = 0.0
+    issue_type_counts: defaultdict = field(default_factory=lambda: defaultdict(int))
+    bug_count: int = 0
+    story_count: int = 0
+    # Running sum/count of completed-issue cycle times, for the average
+    cycle_time_sum: float = 0.0
+    cycle_time_count: int = 0
+
+
 def compute_metrics(issues):
     """
-    Build per-assignee metrics from list of issues with enhanced KPIs.
+    Build per-assignee metrics from an iterable of issues with enhanced KPIs.
+    Field extraction is done inline on a single "fields" lookup per issue.
     """
-    metrics = defaultdict(lambda: {
-        "total_issues": 0,
-        "completed_issues": 0,
-        "total_story_points": 0.0,
-        "completed_story_points": 0.0,
-        "issue_type_counts": defaultdict(int),
-        "bug_count": 0,
-        "story_count": 0,
-        "cycle_times": [],  # For calculating averages
-        "story_points_list": [],  # For individual issue story points
-    })
+    metrics = {}
 
-    for issue in issues:
-        assignee = get_assignee_name(issue)
-        status_cat = get_status_category(issue)
-        issue_type = get_issue_type(issue)
-        story_points = get_story_points(issue)
-        cycle_time = get_cycle_time_days(issue)
+    # Bind globals to locals for the hot loop
+    sp_field = STORY_POINTS_FIELD
+    done_set = DONE_STATUS_CATEGORIES
 
-        m = metrics[assignee]
+    for issue in issues:
+        fields = issue["fields"]
 
-        m["total_issues"] += 1
-        m["total_story_points"] += story_points
-        m["issue_type_counts"][issue_type] += 1
-        
-        # Track story points per issue (including 0-point issues)
-        m["story_points_list"].append(story_points)
+        assignee = fields.get("assignee")
+        if assignee is None:
+            assignee_name = "Unassigned"
+        else:
+            assignee_name = assignee.get("displayName") or assignee.get("emailAddress") or "Unknown"
+
+        status = fields.get("status") or {}
+        status_category = status.get("statusCategory") or {}
+        # Typically: "new", "indeterminate", "done"
+        status_cat = status_category.get("key", "").lower()
+
+        issue_type = (fields.get("issuetype") or {}).get("name", "Unknown")
+        issue_type_lower = issue_type.lower()
+
+        # Story points may be None or missing
+        sp = fields.get(sp_field)
+        try:
+            story_points = float(sp) if sp is not None else 0.0
+        except (TypeError, ValueError):
+            story_points = 0.0
+
+        m = metrics.get(assignee_name)
+        if m is None:
+            m = metrics[assignee_name] = AssigneeMetrics()
+
+        m.total_issues += 1
+        m.total_story_points += story_points
+        m.issue_type_counts[issue_type] += 1
         
         # Count bugs and stories for quality metrics
-        if issue_type.lower() == "bug":
-            m["bug_count"] += 1
-        elif issue_type.lower() == "story":
-            m["story_count"] += 1
-
-        if status_cat in DONE_STATUS_CATEGORIES:
-            m["completed_issues"] += 1
-            m["completed_story_points"] += story_points
+        if issue_type_lower == "bug":
+            m.bug_count += 1
+        elif issue_type_lower == "story":
+            m.story_count += 1
+
+        if status_cat in done_set:
+            m.completed_issues += 1
+            m.completed_story_points += story_points
             # Only track cycle time for completed issues
+            cycle_time = get_cycle_time_days(fields)
             if cycle_time > 0:
-                m["cycle_times"].append(cycle_time)
+                m.cycle_time_sum += cycle_time
+                m.cycle_time_count += 1
 
     return metrics
 
 
 def compute_sprint_totals(metrics):
     """
-    Calculate sprint-wide totals and averages.
+    Calculate sprint-wide totals and averages in a single pass over assignees.
     """
     totals = {
         "total_issues": 0,
@@ -303,27 +436,55 @@ def compute_sprint_totals(metrics):
         "completed_story_points": 0.0,
         "total_bugs": 0,
         "total_stories": 0,
-        "all_cycle_times": [],
-        "all_story_points": [],
-        "assignee_story_points": [],  # Story points per assignee for distribution analysis
+        "cycle_time_sum": 0.0,
+        "cycle_time_count": 0,
     }
     
+    # Story points per assignee for workload distribution, accumulated with
+    # Welford's method so no per-assignee list is kept
+    workload_n = 0
+    workload_mean = 0.0
+    workload_m2 = 0.0
+    min_workload = max_workload = 0.0
+    
     for assignee, m in metrics.items():
         if assignee == "Unassigned":
             continue  # Skip unassigned for team metrics
             
-        totals["total_issues"] += m["total_issues"]
-        totals["completed_issues"] += m["completed_issues"]
-        totals["total_story_points"] += m["total_story_points"]
-        totals["completed_story_points"] += m["completed_story_points"]
-        totals["total_bugs"] += m["bug_count"]
-        totals["total_stories"] += m["story_count"]
-        totals["all_cycle_times"].extend(m["cycle_times"])
-        totals["all_story_points"].extend(m["story_points_list"])
+        totals["total_issues"] += m.total_issues
+        totals["completed_issues"] += m.completed_issues
+        totals["total_story_points"] += m.total_story_points
+        totals["completed_story_points"] += m.completed_story_points
+        totals["total_bugs"] += m.bug_count
+        totals["total_stories"] += m.story_count
+        totals["cycle_time_sum"] += m.cycle_time_sum
+        totals["cycle_time_count"] += m.cycle_time_count
         
-        # Track story points per assignee for workload distribution
-        if m["total_story_points"] > 0:
-            totals["assignee_story_points"].append(m["total_story_points"])
+        sp = m.total_story_points
+        if sp > 0:
+            if workload_n == 0:
+                min_workload = max_workload = sp
+            else:
+                min_workload = min(min_workload, sp)
+                max_workload = max(max_workload, sp)
+            workload_n += 1
+            delta = sp - workload_mean
+            workload_mean += delta / workload_n
+            workload_m2 += delta * (sp - workload_mean)
+    
+    totals["avg_cycle_time"] = (
+        totals["cycle_time_sum"] / totals["cycle_time_count"]
+        if totals["cycle_time_count"] else 0.0
+    )
+    # Every issue counts towards the per-task average, including 0-point issues
+    totals["avg_story_points"] = (
+        totals["total_story_points"] / totals["total_issues"]
+        if totals["total_issues"] else 0.0
+    )
+    totals["min_workload"] = min_workload
+    totals["max_workload"] = max_workload
+    totals["avg_workload"] = workload_mean
+    totals["workload_std"] = (workload_m2 / (workload_n - 1)) ** 0.5 if workload_n > 1 else 0.0
     
     return totals
 
@@ -338,7 +499,7 @@ def write_csv(metrics, sprint_id: int):
     # Collect all issue types seen to make consistent columns
     all_issue_types = set()
     for m in metrics.values():
-        all_issue_types.update(m["issue_type_counts"].keys())
+        all_issue_types.update(m.issue_type_counts.keys())
     all_issue_types = sorted(all_issue_types)
 
     fieldnames = [
@@ -356,90 +517,88 @@ def write_csv(metrics, sprint_id: int):
     ] + [f"Issues: {t}" for t in all_issue_types]
 
     with open(output_csv, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        width = len(fieldnames)
 
-        # Write individual assignee metrics
+        # Write individual assignee metrics, in fieldnames order
         for assignee, m in sorted(metrics.items(), key=lambda x: x[0].lower()):
-            total_issues = m["total_issues"]
-            completed_issues = m["completed_issues"]
-            total_sp = m["total_story_points"]
-            completed_sp = m["completed_story_points"]
+            total_issues = m.total_issues
+            completed_issues = m.completed_issues
+            total_sp = m.total_story_points
+            completed_sp = m.completed_story_points
             
             # Calculate enhanced metrics
             avg_sp_per_issue = round(total_sp / total_issues, 1) if total_issues > 0 else 0.0
-            avg_cycle_time = round(statistics.mean(m["cycle_times"]), 1) if m["cycle_times"] else 0.0
-            bug_ratio = round(100.0 * m["bug_count"] / total_issues, 1) if total_issues > 0 else 0.0
+            avg_cycle_time = round(m.cycle_time_sum / m.cycle_time_count, 1) if m.cycle_time_count else 0.0
+            bug_ratio = round(100.0 * m.bug_count / total_issues, 1) if total_issues > 0 else 0.0
             
             # Workload score (normalized story points - higher means more work)
             workload_score = round(total_sp / max(1, total_issues), 1)
 
-            row = {
-                "Assignee": assignee,
-                "Total Issues": total_issues,
-                "Completed Issues": completed_issues,
-                "Completion % (Issues)": (
+            row = [
+                assignee,
+                total_issues,
+                completed_issues,
+                (
                     round(100.0 * completed_issues / total_issues, 1)
                     if total_issues > 0 else 0.0
                 ),
-                "Total Story Points": total_sp,
-                "Completed Story Points": completed_sp,
-                "Completion % (Story Points)": (
+                total_sp,
+                completed_sp,
+                (
                     round(100.0 * completed_sp / total_sp, 1)
                     if total_sp > 0 else 0.0
                 ),
-                "Avg Story Points per Issue": avg_sp_per_issue,
-                "Avg Cycle Time (Days)": avg_cycle_time,
-                "Bug Ratio (%)": bug_ratio,
-                "Workload Score": workload_score,
-            }
-
-            for t in all_issue_types:
-                row[f"Issues: {t}"] = m["issue_type_counts"].get(t, 0)
+                avg_sp_per_issue,
+                avg_cycle_time,
+                bug_ratio,
+                workload_score,
+            ]
+            issue_type_counts = m.issue_type_counts
+            row.extend(issue_type_counts.get(t, 0) for t in all_issue_types)
 
             writer.writerow(row)
 
         # Add separator and sprint totals
-        writer.writerow({})  # Empty row for separation
+        writer.writerow([""] * width)  # Empty row for separation
         
         # Sprint Summary Section
         sprint_completion_issues = round(100.0 * sprint_totals["completed_issues"] / sprint_totals["total_issues"], 1) if sprint_totals["total_issues"] > 0 else 0.0
         sprint_completion_sp = round(100.0 * sprint_totals["completed_story_points"] / sprint_totals["total_story_points"], 1) if sprint_totals["total_story_points"] > 0 else 0.0
         
-        avg_cycle_time_sprint = round(statistics.mean(sprint_totals["all_cycle_times"]), 1) if sprint_totals["all_cycle_times"] else 0.0
-        avg_sp_per_task = round(statistics.mean(sprint_totals["all_story_points"]), 1) if sprint_totals["all_story_points"] else 0.0
+        avg_cycle_time_sprint = round(sprint_totals["avg_cycle_time"], 1)
+        avg_sp_per_task = round(sprint_totals["avg_story_points"], 1)
         
         # Workload distribution analysis
-        if sprint_totals["assignee_story_points"]:
-            min_workload = min(sprint_totals["assignee_story_points"])
-            max_workload = max(sprint_totals["assignee_story_points"])
-            avg_workload = round(statistics.mean(sprint_totals["assignee_story_points"]), 1)
-            workload_std = round(statistics.stdev(sprint_totals["assignee_story_points"]), 1) if len(sprint_totals["assignee_story_points"]) > 1 else 0.0
-        else:
-            min_workload = max_workload = avg_workload = workload_std = 0.0
+        min_workload = sprint_totals["min_workload"]
+        max_workload = sprint_totals["max_workload"]
+        avg_workload = round(sprint_totals["avg_workload"], 1)
+        workload_std = round(sprint_totals["workload_std"], 1)
         
         team_velocity = sprint_totals["completed_story_points"]
         bug_to_story_ratio = round(sprint_totals["total_bugs"] / max(1, sprint_totals["total_stories"]) * 100, 1)
 
-        # Write sprint summary rows
+        # Write sprint summary rows as (Assignee, Total Issues) pairs
         summary_rows = [
-            {"Assignee": "=== SPRINT SUMMARY ==="},
-            {"Assignee": "Total Tasks Completed", "Total Issues": f"{sprint_totals['completed_issues']}/{sprint_totals['total_issues']} ({sprint_completion_issues}%)"},
-            {"Assignee": "Total Story Points Completed", "Total Issues": f"{sprint_totals['completed_story_points']}/{sprint_totals['total_story_points']} ({sprint_completion_sp}%)"},
-            {"Assignee": "Team Velocity (Completed SP)", "Total Issues": team_velocity},
-            {"Assignee": "Average Cycle Time", "Total Issues": f"{avg_cycle_time_sprint} days"},
-            {"Assignee": "Average Story Points per Task", "Total Issues": avg_sp_per_task},
-            {"Assignee": "Bug-to-Story Ratio", "Total Issues": f"{bug_to_story_ratio}%"},
-            {"Assignee": ""},
-            {"Assignee": "=== WORKLOAD DISTRIBUTION ==="},
-            {"Assignee": "Min Story Points (Assignee)", "Total Issues": min_workload},
-            {"Assignee": "Max Story Points (Assignee)", "Total Issues": max_workload},
-            {"Assignee": "Avg Story Points (Assignee)", "Total Issues": avg_workload},
-            {"Assignee": "Workload Std Deviation", "Total Issues": workload_std},
+            ("=== SPRINT SUMMARY ===",),
+            ("Total Tasks Completed", f"{sprint_totals['completed_issues']}/{sprint_totals['total_issues']} ({sprint_completion_issues}%)"),
+            ("Total Story Points Completed", f"{sprint_totals['completed_story_points']}/{sprint_totals['total_story_points']} ({sprint_completion_sp}%)"),
+            ("Team Velocity (Completed SP)", team_velocity),
+            ("Average Cycle Time", f"{avg_cycle_time_sprint} days"),
+            ("Average Story Points per Task", avg_sp_per_task),
+            ("Bug-to-Story Ratio", f"{bug_to_story_ratio}%"),
+            ("",),
+            ("=== WORKLOAD DISTRIBUTION ===",),
+            ("Min Story Points (Assignee)", min_workload),
+            ("Max Story Points (Assignee)", max_workload),
+            ("Avg Story Points (Assignee)", avg_workload),
+            ("Workload Std Deviation", workload_std),
         ]
         
         for row in summary_rows:
-            writer.writerow(row)
+            # Pad to the full width so the output matches the table columns
+            writer.writerow(row + ("",) * (width - len(row)))
 
     print(f"Wrote enhanced metrics to {output_csv}")
     print(f"Sprint Summary:")
@@ -457,13 +616,24 @@ def parse_args():
     parser.add_argument(
         "--sprint-id",
         type=int,
+        nargs="+",
         required=True,
-        help="Jira sprint ID (from the Sprint Report URL, e.g., sprint=345).",
+        help=(
+            "One or more Jira sprint IDs (from the Sprint Report URL, e.g., sprint=345). "
+            "Each sprint gets its own CSV."
+        ),
+    )
+    parser.add_argument(
+        "--refresh-fields",
+        action="store_true",
+        help="Ignore the cached Jira field metadata and fetch it again.",
     )
     return parser.parse_args()
 
 
 def main():
+    load_config()
+
     # Check required config (except STORY_POINTS_FIELD which can be auto-detected)
     missing = []
     if not JIRA_BASE_URL:
@@ -485,26 +655,32 @@ def main():
         sys.exit(1)
     
     args = parse_args()
-    sprint_id = args.sprint_id
+    sprint_ids = args.sprint_id
+
+    if args.refresh_fields:
+        clear_fields_cache(JIRA_BASE_URL)
     
-    # Auto-detect story points field if not provided
+    # Auto-detect story points field if not provided. The field is instance-wide,
+    # so detect it once and reuse it for every sprint.
     global STORY_POINTS_FIELD
     if not STORY_POINTS_FIELD:
         print("Story points field not provided in .env, attempting auto-detection...")
-        STORY_POINTS_FIELD = detect_story_points_field(sprint_id)
+        STORY_POINTS_FIELD = detect_story_points_field(sprint_ids[0])
         print(f"Using story points field: {STORY_POINTS_FIELD}\n")
     else:
         print(f"Using story points field from .env: {STORY_POINTS_FIELD}\n")
 
-    print(f"Fetching issues for sprint {sprint_id}...")
-    issues = fetch_issues_for_sprint(sprint_id)
-    print(f"Fetched {len(issues)} issues.")
+    # All sprints share the same session and field caches within this process
+    for sprint_id in sprint_ids:
+        print(f"Fetching issues for sprint {sprint_id} and computing enhanced metrics...")
+        metrics = compute_metrics(iter_issues_for_sprint(sprint_id))
+        issue_count = sum(m.total_issues for m in metrics.values())
+        print(f"Processed {issue_count} issues.")
 
-    print("Computing enhanced metrics...")
-    metrics = compute_metrics(issues)
+        print("Writing enhanced CSV with KPIs...")
+        write_csv(metrics, sprint_id)
+        print()
 
-    print("Writing enhanced CSV with KPIs...")
-    write_csv(metrics, sprint_id)
     print("Done! Enhanced KPI report generated with:")
     print("  ✓ Individual assignee metrics")
     print("  ✓ Sprint completion totals")